@@ -1,18 +1,36 @@
 from abc import ABC, abstractmethod
+import asyncio
 import json
+import time
 from typing import Any
 
 from fastapi import HTTPException, Request
 from fastapi.responses import HTMLResponse
+import httpx
 
 from integrations.base.integration_item import IntegrationItem
+from integrations.base.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HedgeBudget,
+    LatencyTracker,
+    hedged,
+)
 from redis_client import delete_key_redis, get_value_redis
+from settings import Settings
+from tracing import SPAN_KIND_CLIENT, span
 
 
 class OAuthIntegration(ABC):
     STATE_TTL: int = 600
     CREDENTIALS_TTL: int = 600
     PREFIX: str = ""
+    SETTINGS: Settings
+
+    def __init__(self) -> None:
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._latencies: dict[str, LatencyTracker] = {}
+        self._hedge_budgets: dict[str, HedgeBudget] = {}
 
     @abstractmethod
     async def authorize(self, user_id: str, org_id: str) -> str: ...
@@ -31,9 +49,111 @@ class OAuthIntegration(ABC):
             raise HTTPException(status_code=400, detail="No credentials found.")
 
         try:
-            credentials = json.loads(raw)
+            with span("json.parse"):
+                credentials = json.loads(raw)
         except json.JSONDecodeError:
             raise HTTPException(status_code=500, detail="Corrupted credentials data.")
 
         await delete_key_redis(key)
         return credentials
+
+    def _breaker(self, endpoint: str) -> CircuitBreaker:
+        if endpoint not in self._breakers:
+            self._breakers[endpoint] = CircuitBreaker(
+                failure_threshold=self.SETTINGS.breaker_failure_threshold,
+                reset_timeout=self.SETTINGS.breaker_reset_timeout,
+            )
+        return self._breakers[endpoint]
+
+    def _latency(self, endpoint: str) -> LatencyTracker:
+        if endpoint not in self._latencies:
+            self._latencies[endpoint] = LatencyTracker(
+                quantile=self.SETTINGS.hedge_quantile,
+                default=self.SETTINGS.hedge_delay,
+            )
+        return self._latencies[endpoint]
+
+    def _hedge_budget(self, endpoint: str) -> HedgeBudget:
+        if endpoint not in self._hedge_budgets:
+            self._hedge_budgets[endpoint] = HedgeBudget(
+                ratio=self.SETTINGS.hedge_budget
+            )
+        return self._hedge_budgets[endpoint]
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        method: str,
+        url: str,
+        *,
+        hedge: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a provider request through the endpoint's circuit breaker.
+
+        Transport errors and 5xx responses count as failures. Pass ``hedge=True``
+        only for idempotent calls; it takes effect when enabled in settings.
+        """
+        breaker = self._breaker(endpoint)
+        latency = self._latency(endpoint)
+
+        attempts = 0
+
+        async def attempt() -> httpx.Response:
+            # Only the original attempt feeds the latency window, giving one
+            # sample per call. If it loses to a hedge, the time it had run when
+            # cancelled is kept as a lower bound for the slow tail.
+            nonlocal attempts
+            original = attempts == 0
+            attempts += 1
+            with span(
+                f"HTTP {method}",
+                kind=SPAN_KIND_CLIENT,
+                **{"http.request.method": method, "url.full": url},
+            ) as current:
+                started = time.monotonic()
+                try:
+                    response = await client.request(method, url, **kwargs)
+                except asyncio.CancelledError:
+                    if original:
+                        latency.observe(time.monotonic() - started)
+                    raise
+                # Fast 5xx responses would drag the hedge delay down.
+                if original and response.status_code < 500:
+                    latency.observe(time.monotonic() - started)
+                current.set_attribute("http.response.status_code", response.status_code)
+                return response
+
+        with span(
+            f"{self.PREFIX}.{endpoint}",
+            **{"integration.provider": self.PREFIX, "integration.endpoint": endpoint},
+        ) as current:
+            current.set_attribute("circuit.state", breaker.state)
+            try:
+                probe = breaker.before_call()
+            except CircuitOpenError:
+                raise HTTPException(
+                    status_code=503,
+                    detail=f"{self.PREFIX} {endpoint} is temporarily unavailable.",
+                )
+
+            try:
+                if hedge and self.SETTINGS.hedge_enabled:
+                    response = await hedged(
+                        attempt, latency.delay(), self._hedge_budget(endpoint)
+                    )
+                else:
+                    response = await attempt()
+            except Exception:
+                breaker.record_failure(probe)
+                raise
+            except BaseException:
+                breaker.release(probe)
+                raise
+
+            if response.status_code >= 500:
+                breaker.record_failure(probe)
+            else:
+                breaker.record_success(probe)
+            return response
@@ -0,0 +1,153 @@
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+import time
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """Tracks consecutive failures of one upstream endpoint.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and calls
+    are rejected for ``reset_timeout`` seconds. Then a single probe is let
+    through (half-open): success closes the circuit, failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def before_call(self) -> bool:
+        """Admit a call, returning whether it is the half-open probe.
+
+        The returned flag must be passed back to the ``record_*``/``release``
+        methods so that late outcomes cannot override the current state.
+        """
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError
+            self.state = self.HALF_OPEN
+
+        if self.state == self.HALF_OPEN:
+            if self._probe_in_flight:
+                raise CircuitOpenError
+            self._probe_in_flight = True
+            return True
+
+        return False
+
+    def record_success(self, probe: bool) -> None:
+        if self.state == self.HALF_OPEN and probe:
+            self.state = self.CLOSED
+            self._probe_in_flight = False
+        if self.state == self.CLOSED:
+            self._failures = 0
+
+    def record_failure(self, probe: bool) -> None:
+        if self.state == self.HALF_OPEN and probe:
+            self._open()
+        elif self.state == self.CLOSED:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._open()
+
+    def release(self, probe: bool) -> None:
+        """Free the half-open probe slot without recording an outcome."""
+        if probe:
+            self._probe_in_flight = False
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+
+class LatencyTracker:
+    """Keeps a rolling window of latencies to derive the hedge delay."""
+
+    MIN_SAMPLES: int = 20
+
+    def __init__(self, quantile: float, default: float, window: int = 100) -> None:
+        self.quantile = quantile
+        self.default = default
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def delay(self) -> float:
+        if len(self._samples) < self.MIN_SAMPLES:
+            return self.default
+        ordered = sorted(self._samples)
+        index = min(int(len(ordered) * self.quantile), len(ordered) - 1)
+        return ordered[index]
+
+
+class HedgeBudget:
+    """Caps hedges to ``ratio`` of calls so a slow provider is not sent double
+    the load. Each call earns ``ratio`` tokens and each hedge spends one."""
+
+    def __init__(self, ratio: float, burst: float = 10.0) -> None:
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = 0.0
+
+    def deposit(self) -> None:
+        self._tokens = min(self._tokens + self.ratio, self.burst)
+
+    def spend(self) -> bool:
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+
+async def hedged(
+    call: Callable[[], Awaitable[T]],
+    delay: float,
+    budget: HedgeBudget | None = None,
+) -> T:
+    """Run ``call``; if it has not finished after ``delay`` seconds and the
+    budget allows it, fire a second attempt and return whichever succeeds
+    first."""
+    if budget is not None:
+        budget.deposit()
+
+    tasks = {asyncio.ensure_future(call())}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done and (budget is None or budget.spend()):
+            tasks.add(asyncio.ensure_future(call()))
+
+        error: BaseException | None = None
+        while tasks:
+            done, tasks = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        assert error is not None
+        raise error
+    finally:
+        # Wait for cancelled attempts to unwind so none outlives the caller's
+        # client or keeps a half-open probe in flight after we return.
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
@@ -7,15 +7,15 @@ import json
 import secrets
 from typing import Any
 
-from fastapi import HTTPException, Request, Response
+from fastapi import HTTPException, Request
 from fastapi.responses import HTMLResponse
 import httpx
-import requests
 
 from integrations.base import OAuthIntegration
 from integrations.base.integration_item import IntegrationItem
 from redis_client import add_key_value_redis, delete_key_redis, get_value_redis
 from settings import airtable_settings
+from tracing import span
 
 
 def create_integration_item_metadata_object(
@@ -33,28 +33,9 @@ def create_integration_item_metadata_object(
     return integration_item_metadata
 
 
-def fetch_items(
-    access_token: str, url: str, aggregated_response: list, offset=None
-) -> None:
-    """Fetching the list of bases"""
-    params = {"offset": offset} if offset is not None else {}
-    headers = {"Authorization": f"Bearer {access_token}"}
-    response = requests.get(url, headers=headers, params=params)
-
-    if response.status_code == 200:
-        results = response.json().get("bases", {})
-        offset = response.json().get("offset", None)
-
-        for item in results:
-            aggregated_response.append(item)
-        if offset is not None:
-            fetch_items(access_token, url, aggregated_response, offset)
-        else:
-            return
-
-
 class AirtableIntegration(OAuthIntegration):
     PREFIX = "airtable"
+    SETTINGS = airtable_settings
 
     async def authorize(self, user_id: str, org_id: str) -> str:
         state_data = {
@@ -123,7 +104,10 @@ class AirtableIntegration(OAuthIntegration):
         async with httpx.AsyncClient() as client:
             encoded_client_id_secret = airtable_settings.encoded_client_id_secret
             response, _, _ = await asyncio.gather(
-                client.post(
+                self._send(
+                    client,
+                    "token",
+                    "POST",
                     "https://airtable.com/oauth2/v1/token",
                     data={
                         "grant_type": "authorization_code",
@@ -154,26 +138,75 @@ class AirtableIntegration(OAuthIntegration):
             """
         )
 
+    async def fetch_items(
+        self,
+        client: httpx.AsyncClient,
+        access_token: str,
+        url: str,
+        aggregated_response: list,
+        offset=None,
+    ) -> None:
+        """Fetching the list of bases"""
+        params = {"offset": offset} if offset is not None else {}
+        headers = {"Authorization": f"Bearer {access_token}"}
+        response = await self._send(
+            client, "bases", "GET", url, hedge=True, headers=headers, params=params
+        )
+
+        if response.status_code == 200:
+            with span("json.parse"):
+                body = response.json()
+            results = body.get("bases", {})
+            offset = body.get("offset", None)
+
+            for item in results:
+                aggregated_response.append(item)
+            if offset is not None:
+                await self.fetch_items(
+                    client, access_token, url, aggregated_response, offset
+                )
+            else:
+                return
+
     async def get_items(self, credentials: str) -> list[IntegrationItem]:
-        parsed_credentials = json.loads(credentials)
+        with span("json.parse"):
+            parsed_credentials = json.loads(credentials)
         url = "https://api.airtable.com/v0/meta/bases"
-        list_of_integration_item_metadata = []
-        list_of_responses: list[Response] = []
+        responses: list[dict[str, Any]] = []
+        tables_by_base: list[list[dict[str, Any]]] = []
 
-        fetch_items(parsed_credentials.get("access_token"), url, list_of_responses)
-        for response in list_of_responses:
-            list_of_integration_item_metadata.append(
-                create_integration_item_metadata_object(response, "Base")
-            )
-            tables_response = requests.get(
-                f'https://api.airtable.com/v0/meta/bases/{response.get("id")}/tables',
-                headers={
-                    "Authorization": f'Bearer {parsed_credentials.get("access_token")}'
-                },
+        async with httpx.AsyncClient() as client:
+            await self.fetch_items(
+                client, parsed_credentials.get("access_token"), url, responses
             )
-            if tables_response.status_code == 200:
-                tables_response = tables_response.json()
-                for table in tables_response["tables"]:
+            for response in responses:
+                tables_url = f'{url}/{response.get("id")}/tables'
+                tables_response = await self._send(
+                    client,
+                    "tables",
+                    "GET",
+                    tables_url,
+                    hedge=True,
+                    headers={
+                        "Authorization": (
+                            f'Bearer {parsed_credentials.get("access_token")}'
+                        )
+                    },
+                )
+                tables = []
+                if tables_response.status_code == 200:
+                    with span("json.parse"):
+                        tables = tables_response.json()["tables"]
+                tables_by_base.append(tables)
+
+        list_of_integration_item_metadata = []
+        count = len(responses) + sum(len(tables) for tables in tables_by_base)
+        with span("pydantic.construct", model="IntegrationItem", count=count):
+            for response, tables in zip(responses, tables_by_base):
+                list_of_integration_item_metadata.append(
+                    create_integration_item_metadata_object(response, "Base")
+                )
+                for table in tables:
                     list_of_integration_item_metadata.append(
                         create_integration_item_metadata_object(
                             table,
@@ -9,15 +9,16 @@ from urllib.parse import urlencode
 from fastapi import HTTPException, Request
 from fastapi.responses import HTMLResponse
 import httpx
-import requests
 
 from integrations.base import IntegrationItem, OAuthIntegration
 from redis_client import add_key_value_redis, delete_key_redis, get_value_redis
 from settings import hubspot_settings
+from tracing import span
 
 
 class HubSpotIntegration(OAuthIntegration):
     PREFIX = "hubspot"
+    SETTINGS = hubspot_settings
 
     async def authorize(self, user_id: str, org_id: str) -> str:
         state_data = {
@@ -63,7 +64,10 @@ class HubSpotIntegration(OAuthIntegration):
 
         async with httpx.AsyncClient() as client:
             response, _ = await asyncio.gather(
-                client.post(
+                self._send(
+                    client,
+                    "token",
+                    "POST",
                     "https://api.hubspot.com/oauth/v1/token",
                     data={
                         "grant_type": "authorization_code",
@@ -94,28 +98,36 @@ class HubSpotIntegration(OAuthIntegration):
         )
 
     async def get_items(self, credentials: str) -> list[IntegrationItem]:
-        parsed_credentials = json.loads(
-            credentials.encode("utf-8").decode("unicode_escape")
-        )
-        response = requests.get(
-            "https://api.hubspot.com/crm/v3/objects/companies",
-            headers={
-                "Authorization": f'Bearer {parsed_credentials.get("access_token")}',
-            },
-        )
+        with span("json.parse"):
+            parsed_credentials = json.loads(
+                credentials.encode("utf-8").decode("unicode_escape")
+            )
+        async with httpx.AsyncClient() as client:
+            response = await self._send(
+                client,
+                "companies",
+                "GET",
+                "https://api.hubspot.com/crm/v3/objects/companies",
+                hedge=True,
+                headers={
+                    "Authorization": f'Bearer {parsed_credentials.get("access_token")}',
+                },
+            )
         response.raise_for_status()
-        results = response.json().get("results", [])
+        with span("json.parse"):
+            results = response.json().get("results", [])
 
         list_of_integration_item_metadata = []
-        for result in results:
-            list_of_integration_item_metadata.append(
-                IntegrationItem(
-                    id=result.get("id"),
-                    url=result.get("url"),
-                    creation_time=result.get("createdAt"),
-                    last_modified_time=result.get("updatedAt"),
-                    name=result.get("properties", {}).get("name"),
+        with span("pydantic.construct", model="IntegrationItem", count=len(results)):
+            for result in results:
+                list_of_integration_item_metadata.append(
+                    IntegrationItem(
+                        id=result.get("id"),
+                        url=result.get("url"),
+                        creation_time=result.get("createdAt"),
+                        last_modified_time=result.get("updatedAt"),
+                        name=result.get("properties", {}).get("name"),
+                    )
                 )
-            )
 
         return list_of_integration_item_metadata
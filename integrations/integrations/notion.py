@@ -12,6 +12,7 @@ import httpx
 from integrations.base import IntegrationItem, OAuthIntegration
 from redis_client import add_key_value_redis, delete_key_redis, get_value_redis
 from settings import notion_settings
+from tracing import span
 
 
 def recursive_dict_search(data: list | dict[str, Any], target_key: str) -> Any | None:
@@ -34,11 +35,18 @@ def recursive_dict_search(data: list | dict[str, Any], target_key: str) -> Any |
     return None
 
 
+def get_item_name(response_json: dict[str, Any]) -> str:
+    """finds the display name of an item in the response"""
+    name = recursive_dict_search(response_json["properties"], "content")
+    name = recursive_dict_search(response_json, "content") if name is None else name
+    name = "multi_select" if name is None else name
+    return response_json["object"] + " " + name
+
+
 def create_integration_item_metadata_object(
-    response_json: dict[str, Any],
+    response_json: dict[str, Any], name: str
 ) -> IntegrationItem:
     """creates an integration metadata object from the response"""
-    name = recursive_dict_search(response_json["properties"], "content")
     parent_type = (
         ""
         if response_json["parent"]["type"] is None
@@ -50,10 +58,6 @@ def create_integration_item_metadata_object(
         else response_json["parent"][parent_type]
     )
 
-    name = recursive_dict_search(response_json, "content") if name is None else name
-    name = "multi_select" if name is None else name
-    name = response_json["object"] + " " + name
-
     integration_item_metadata = IntegrationItem(
         id=response_json["id"],
         type=response_json["object"],
@@ -68,6 +72,7 @@ def create_integration_item_metadata_object(
 
 class NotionIntegration(OAuthIntegration):
     PREFIX = "notion"
+    SETTINGS = notion_settings
 
     async def authorize(self, user_id: str, org_id: str) -> str:
         state_data = {
@@ -109,7 +114,10 @@ class NotionIntegration(OAuthIntegration):
         async with httpx.AsyncClient() as client:
             encoded_client_id_secret = notion_settings.encoded_client_id_secret
             response, _ = await asyncio.gather(
-                client.post(
+                self._send(
+                    client,
+                    "token",
+                    "POST",
                     "https://api.notion.com/v1/oauth/token",
                     json={
                         "grant_type": "authorization_code",
@@ -139,12 +147,18 @@ class NotionIntegration(OAuthIntegration):
         )
 
     async def get_items(self, credentials: str) -> list[IntegrationItem]:
-        parsed_credentials = json.loads(
-            credentials.encode("utf-8").decode("unicode_escape")
-        )
+        with span("json.parse"):
+            parsed_credentials = json.loads(
+                credentials.encode("utf-8").decode("unicode_escape")
+            )
         async with httpx.AsyncClient() as client:
-            response = await client.post(
+            # Search is read-only, so it is safe to hedge despite being a POST.
+            response = await self._send(
+                client,
+                "search",
+                "POST",
                 "https://api.notion.com/v1/search",
+                hedge=True,
                 headers={
                     "Authorization": f"Bearer {parsed_credentials.get('access_token')}",
                     "Notion-Version": "2022-06-28",
@@ -152,10 +166,16 @@ class NotionIntegration(OAuthIntegration):
             )
 
         response.raise_for_status()
-        results = response.json().get("results", [])
+        with span("json.parse"):
+            results = response.json().get("results", [])
+
+        with span("notion.recursive_dict_search", count=len(results)):
+            names = [get_item_name(result) for result in results]
 
-        list_of_integration_item_metadata = [
-            create_integration_item_metadata_object(result) for result in results
-        ]
+        with span("pydantic.construct", model="IntegrationItem", count=len(results)):
+            list_of_integration_item_metadata = [
+                create_integration_item_metadata_object(result, name)
+                for result, name in zip(results, names)
+            ]
 
         return list_of_integration_item_metadata
@@ -1,7 +1,18 @@
-from fastapi import FastAPI, Form, Request
+import os
+import re
+import secrets
+
+from fastapi import FastAPI, Form, Header, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from integrations.integrations_map import get_integration
+import profiling
+from settings import app_settings
+import tracing
+
+TRACE_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+PROFILE_ID_RE = re.compile(r"^[0-9a-f]{32}-[0-9a-f]{16}$")
 
 app = FastAPI()
 
@@ -18,6 +29,45 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    with tracing.span(
+        f"{request.method} {request.url.path}",
+        traceparent=request.headers.get("traceparent"),
+        kind=tracing.SPAN_KIND_SERVER,
+        **{"http.request.method": request.method, "url.path": request.url.path},
+    ) as root:
+        profiler = None
+        if profiling.should_profile(request.headers.get("X-Profile")):
+            profiler = profiling.SamplingProfiler(app_settings.profile_interval)
+            profiler.start()
+        profile_id = profiling.profile_id(root.trace_id, root.span_id)
+        saved = False
+        try:
+            response = await call_next(request)
+        finally:
+            if profiler is not None:
+                saved = profiling.save_profile(profile_id, profiler.stop())
+
+        root.set_attribute("http.response.status_code", response.status_code)
+        response.headers["X-Trace-Id"] = root.trace_id
+        if saved:
+            response.headers["X-Profile-Id"] = profile_id
+        return response
+
+
+def check_admin_token(token: str | None) -> None:
+    if not app_settings.admin_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if token is None or not secrets.compare_digest(token, app_settings.admin_token):
+        raise HTTPException(status_code=401, detail="Invalid admin token.")
+
+
+def check_trace_id(trace_id: str) -> None:
+    if not TRACE_ID_RE.match(trace_id):
+        raise HTTPException(status_code=400, detail="Invalid trace id.")
+
+
 @app.get("/")
 def read_root():
     return {"Ping": "Pong"}
@@ -59,3 +109,34 @@ async def get_integration_items(
 ):
     integration = get_integration(integration_name)
     return await integration.get_items(credentials)
+
+
+@app.post("/admin/profile")
+async def arm_profiler(x_admin_token: str | None = Header(None)):
+    check_admin_token(x_admin_token)
+    profiling.arm()
+    return {"armed": True}
+
+
+@app.get("/admin/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(profile_id: str, x_admin_token: str | None = Header(None)):
+    check_admin_token(x_admin_token)
+    if not PROFILE_ID_RE.match(profile_id):
+        raise HTTPException(status_code=400, detail="Invalid profile id.")
+    path = profiling.profile_path(profile_id)
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="No profile found.")
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+@app.get("/admin/traces/{trace_id}")
+async def get_trace(trace_id: str, x_admin_token: str | None = Header(None)):
+    check_admin_token(x_admin_token)
+    check_trace_id(trace_id)
+    if not isinstance(tracing.exporter, tracing.InMemorySpanExporter):
+        raise HTTPException(status_code=404, detail="In-memory tracing is disabled.")
+    spans = tracing.exporter.get_trace(trace_id)
+    if not spans:
+        raise HTTPException(status_code=404, detail="No trace found.")
+    return tracing.to_otlp(spans)
@@ -0,0 +1,99 @@
+from collections import Counter
+import logging
+import os
+import secrets
+import sys
+import threading
+from types import FrameType
+
+from settings import app_settings
+
+logger = logging.getLogger(__name__)
+
+_armed = False
+
+
+class SamplingProfiler:
+    """Samples the stack of one thread at a fixed interval.
+
+    The result is in folded-stack format, which flamegraph.pl and speedscope
+    render as a flame graph. Since the event loop is shared, samples taken while
+    a profiled request is awaiting I/O may belong to other in-flight requests.
+    """
+
+    def __init__(self, interval: float, thread_id: int | None = None) -> None:
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self._stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> str:
+        self._stop.set()
+        self._thread.join()
+        return "".join(f"{stack} {count}\n" for stack, count in self._stacks.items())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self._stacks[self._fold(frame)] += 1
+
+    @staticmethod
+    def _fold(frame: FrameType | None) -> str:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            filename = os.path.basename(code.co_filename)
+            stack.append(f"{code.co_name} ({filename}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(stack))
+
+
+def arm() -> None:
+    """Profile the next incoming request."""
+    global _armed
+    _armed = True
+
+
+def should_profile(profile_header: str | None) -> bool:
+    global _armed
+    if not app_settings.admin_token:
+        return False
+    if profile_header is not None and secrets.compare_digest(
+        profile_header, app_settings.admin_token
+    ):
+        return True
+    if _armed:
+        _armed = False
+        return True
+    return False
+
+
+def profile_id(trace_id: str, span_id: str) -> str:
+    """Identify a profile by its request's root span, since several requests
+    may share a trace id."""
+    return f"{trace_id}-{span_id}"
+
+
+def profile_path(profile_id: str) -> str:
+    return os.path.join(app_settings.profile_dir, f"{profile_id}.folded")
+
+
+def save_profile(profile_id: str, folded: str) -> bool:
+    """Write a profile, returning whether it was saved.
+
+    Failures are logged rather than raised so they never replace the profiled
+    request's response.
+    """
+    try:
+        os.makedirs(app_settings.profile_dir, exist_ok=True)
+        with open(profile_path(profile_id), "w", encoding="utf-8") as f:
+            f.write(folded)
+    except OSError:
+        logger.exception("Could not save profile %s", profile_id)
+        return False
+    return True
@@ -1,6 +1,7 @@
 import redis.asyncio as redis
 
 from settings import app_settings
+from tracing import SPAN_KIND_CLIENT, span
 
 redis_client = redis.Redis(
     host=app_settings.redis_host, port=app_settings.redis_port, db=0
@@ -8,14 +9,29 @@ redis_client = redis.Redis(
 
 
 async def add_key_value_redis(key, value, expire=None):
-    await redis_client.set(key, value)
-    if expire:
-        await redis_client.expire(key, expire)
+    with span(
+        "redis SET",
+        kind=SPAN_KIND_CLIENT,
+        **{"db.system": "redis", "db.operation": "SET"},
+    ):
+        await redis_client.set(key, value)
+        if expire:
+            await redis_client.expire(key, expire)
 
 
 async def get_value_redis(key):
-    return await redis_client.get(key)
+    with span(
+        "redis GET",
+        kind=SPAN_KIND_CLIENT,
+        **{"db.system": "redis", "db.operation": "GET"},
+    ):
+        return await redis_client.get(key)
 
 
 async def delete_key_redis(key):
-    await redis_client.delete(key)
+    with span(
+        "redis DEL",
+        kind=SPAN_KIND_CLIENT,
+        **{"db.system": "redis", "db.operation": "DEL"},
+    ):
+        await redis_client.delete(key)
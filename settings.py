@@ -1,4 +1,5 @@
 import base64
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -9,6 +10,18 @@ class Settings(BaseSettings):
     auth_url: str
     redirect_uri: str
 
+    # Circuit breaker, applied per provider endpoint.
+    breaker_failure_threshold: int = 5
+    breaker_reset_timeout: float = 30.0
+
+    # Hedged requests for idempotent metadata calls. The hedge fires after the
+    # observed ``hedge_quantile`` latency, or ``hedge_delay`` until enough
+    # samples have been collected. At most ``hedge_budget`` of calls are hedged.
+    hedge_enabled: bool = False
+    hedge_delay: float = 0.5
+    hedge_quantile: float = 0.95
+    hedge_budget: float = 0.1
+
     @property
     def encoded_client_id_secret(self) -> str:
         return base64.b64encode(
@@ -20,6 +33,15 @@ class AppSettings(BaseSettings):
     redis_host: str
     redis_port: int
 
+    # Tracing spans are exported to memory (see /admin/traces) or to a JSONL file.
+    trace_exporter: Literal["none", "memory", "file"] = "none"
+    trace_file: str = "traces.jsonl"
+
+    # Admin endpoints and request profiling are disabled unless a token is set.
+    admin_token: str | None = None
+    profile_dir: str = "profiles"
+    profile_interval: float = 0.005
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
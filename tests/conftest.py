@@ -0,0 +1,10 @@
+import os
+
+# Settings are instantiated at import time; provide the required values.
+for prefix in ("NOTION", "AIRTABLE", "HUBSPOT"):
+    os.environ.setdefault(f"{prefix}_CLIENT_ID", "client_id")
+    os.environ.setdefault(f"{prefix}_CLIENT_SECRET", "client_secret")
+    os.environ.setdefault(f"{prefix}_AUTH_URL", "https://example.com/authorize")
+    os.environ.setdefault(f"{prefix}_REDIRECT_URI", "http://localhost:8000/callback")
+os.environ.setdefault("REDIS_HOST", "localhost")
+os.environ.setdefault("REDIS_PORT", "6379")
@@ -0,0 +1,124 @@
+from fastapi.testclient import TestClient
+import pytest
+
+import main
+import profiling
+import redis_client
+from settings import app_settings
+import tracing
+
+TOKEN = "admin-token"
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    exporter = tracing.InMemorySpanExporter()
+    monkeypatch.setattr(tracing, "exporter", exporter)
+    return exporter
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path, exporter):
+    monkeypatch.setattr(app_settings, "admin_token", TOKEN)
+    monkeypatch.setattr(app_settings, "profile_dir", str(tmp_path / "profiles"))
+    monkeypatch.setattr(app_settings, "profile_interval", 0.001)
+    monkeypatch.setattr(profiling, "_armed", False)
+    return TestClient(main.app)
+
+
+def admin(token=TOKEN):
+    return {"X-Admin-Token": token}
+
+
+@pytest.mark.parametrize(
+    "method, path",
+    [
+        ("post", "/admin/profile"),
+        ("get", f"/admin/profiles/{'a' * 32}-{'b' * 16}"),
+        ("get", f"/admin/traces/{'a' * 32}"),
+    ],
+)
+def test_admin_endpoints_require_token(client, monkeypatch, method, path):
+    assert getattr(client, method)(path).status_code == 401
+    assert getattr(client, method)(path, headers=admin("wrong")).status_code == 401
+
+    monkeypatch.setattr(app_settings, "admin_token", None)
+    assert getattr(client, method)(path, headers=admin()).status_code == 404
+
+
+def test_admin_endpoints_validate_ids(client, tmp_path):
+    profile_dir = tmp_path / "profiles"
+    profile_dir.mkdir()
+    (profile_dir / "not-a-profile.folded").write_text("secret 1\n")
+
+    response = client.get("/admin/profiles/not-a-profile", headers=admin())
+    assert response.status_code == 400
+
+    response = client.get("/admin/traces/not-a-trace", headers=admin())
+    assert response.status_code == 400
+
+
+def test_response_carries_trace_id(client, exporter):
+    response = client.get("/")
+
+    trace_id = response.headers["X-Trace-Id"]
+    assert "X-Profile-Id" not in response.headers
+    (root,) = exporter.get_trace(trace_id)
+    assert root.attributes["http.response.status_code"] == 200
+
+
+def test_child_spans_are_parented_to_root(client, exporter, monkeypatch):
+    class FakeRedis:
+        async def get(self, key):
+            return None
+
+    monkeypatch.setattr(redis_client, "redis_client", FakeRedis())
+
+    response = client.post(
+        "/integrations/notion/credentials", data={"user_id": "u", "org_id": "o"}
+    )
+
+    assert response.status_code == 400
+    spans = {s.name: s for s in exporter.get_trace(response.headers["X-Trace-Id"])}
+    root = spans["POST /integrations/notion/credentials"]
+    assert spans["redis GET"].parent_span_id == root.span_id
+
+    response = client.get(f"/admin/traces/{root.trace_id}", headers=admin())
+    assert response.status_code == 200
+
+
+def test_profile_header_profiles_request(client):
+    response = client.get("/", headers={"X-Profile": TOKEN})
+
+    profile_id = response.headers["X-Profile-Id"]
+    assert profile_id.startswith(response.headers["X-Trace-Id"] + "-")
+    assert main.PROFILE_ID_RE.match(profile_id)
+
+    response = client.get(f"/admin/profiles/{profile_id}", headers=admin())
+    assert response.status_code == 200
+
+
+def test_wrong_profile_header_is_ignored(client):
+    response = client.get("/", headers={"X-Profile": "wrong"})
+
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
+
+
+def test_arm_profiles_exactly_one_request(client):
+    assert client.post("/admin/profile", headers=admin()).json() == {"armed": True}
+
+    assert "X-Profile-Id" in client.get("/").headers
+    assert "X-Profile-Id" not in client.get("/").headers
+
+
+def test_profile_save_failure_keeps_response(client, monkeypatch, tmp_path):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    monkeypatch.setattr(app_settings, "profile_dir", str(blocker))
+
+    response = client.get("/", headers={"X-Profile": TOKEN})
+
+    assert response.status_code == 200
+    assert response.json() == {"Ping": "Pong"}
+    assert "X-Profile-Id" not in response.headers
@@ -0,0 +1,216 @@
+import asyncio
+import time
+
+import pytest
+
+from integrations.base.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HedgeBudget,
+    LatencyTracker,
+    hedged,
+)
+
+
+def open_breaker(threshold: int = 2, reset_timeout: float = 60.0) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=threshold, reset_timeout=reset_timeout)
+    for _ in range(threshold):
+        breaker.record_failure(breaker.before_call())
+    return breaker
+
+
+def half_open_breaker() -> CircuitBreaker:
+    return open_breaker(reset_timeout=0.0)
+
+
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60.0)
+    for _ in range(2):
+        breaker.record_failure(breaker.before_call())
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure(breaker.before_call())
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_breaker_success_resets_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60.0)
+    breaker.record_failure(breaker.before_call())
+    breaker.record_success(breaker.before_call())
+    breaker.record_failure(breaker.before_call())
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_allows_single_half_open_probe():
+    breaker = half_open_breaker()
+
+    assert breaker.before_call() is True
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success(True)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.before_call() is False
+
+
+def test_breaker_probe_failure_reopens():
+    breaker = open_breaker(reset_timeout=0.05)
+    time.sleep(0.05)
+
+    breaker.record_failure(breaker.before_call())
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_breaker_release_frees_probe_slot():
+    breaker = half_open_breaker()
+
+    probe = breaker.before_call()
+    breaker.release(probe)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.before_call() is True
+
+
+def test_breaker_ignores_late_success_while_open():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    late = breaker.before_call()
+    breaker.record_failure(breaker.before_call())
+    assert breaker.state == CircuitBreaker.OPEN
+
+    breaker.record_success(late)
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_breaker_ignores_late_results_while_half_open():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    late_success = breaker.before_call()
+    late_failure = breaker.before_call()
+    breaker.record_failure(breaker.before_call())
+
+    probe = breaker.before_call()
+    breaker.record_success(late_success)
+    breaker.record_failure(late_failure)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success(probe)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_hedged_returns_first_without_hedging_when_fast():
+    calls = []
+
+    async def call():
+        calls.append(len(calls))
+        return "first"
+
+    assert asyncio.run(hedged(call, delay=0.5)) == "first"
+    assert calls == [0]
+
+
+def test_hedged_hedge_wins_when_first_is_slow():
+    async def main():
+        calls = []
+
+        async def call():
+            n = len(calls)
+            calls.append(n)
+            await asyncio.sleep(1.0 if n == 0 else 0.01)
+            return n
+
+        started = time.monotonic()
+        result = await hedged(call, delay=0.02)
+        return result, time.monotonic() - started
+
+    result, elapsed = asyncio.run(main())
+    assert result == 1
+    assert elapsed < 0.5
+
+
+def test_hedged_first_error_falls_through_to_hedge():
+    calls = []
+
+    async def call():
+        n = len(calls)
+        calls.append(n)
+        if n == 0:
+            await asyncio.sleep(0.05)
+            raise RuntimeError("boom")
+        await asyncio.sleep(0.1)
+        return n
+
+    assert asyncio.run(hedged(call, delay=0.01)) == 1
+
+
+def test_hedged_raises_when_all_attempts_fail():
+    async def call():
+        await asyncio.sleep(0.02)
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(hedged(call, delay=0.01))
+
+
+def test_hedged_respects_budget():
+    calls = []
+
+    async def call():
+        calls.append(len(calls))
+        await asyncio.sleep(0.05)
+        return "first"
+
+    assert asyncio.run(hedged(call, delay=0.01, budget=HedgeBudget(0.1))) == "first"
+    assert calls == [0]
+
+
+def test_hedge_budget_limits_ratio():
+    budget = HedgeBudget(ratio=0.1)
+    hedges = 0
+    for _ in range(100):
+        budget.deposit()
+        hedges += budget.spend()
+    assert 9 <= hedges <= 10
+
+
+def test_latency_tracker_uses_default_until_enough_samples():
+    tracker = LatencyTracker(quantile=0.95, default=0.5)
+    for _ in range(LatencyTracker.MIN_SAMPLES - 1):
+        tracker.observe(0.01)
+    assert tracker.delay() == 0.5
+
+    tracker.observe(0.01)
+    assert tracker.delay() == 0.01
+
+
+def test_latency_tracker_reports_quantile():
+    tracker = LatencyTracker(quantile=0.95, default=0.5)
+    for i in range(100):
+        tracker.observe(1.0 if i % 5 == 0 else 0.01)
+    assert tracker.delay() == 1.0
+
+
+def test_hedged_cancels_attempts_when_cancelled_during_delay():
+    async def main():
+        finished = []
+
+        async def call():
+            try:
+                await asyncio.sleep(0.2)
+            except asyncio.CancelledError:
+                finished.append("cancelled")
+                raise
+
+        task = asyncio.ensure_future(hedged(call, delay=1.0))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # The attempt must already have unwound when hedged() returns.
+        return list(finished)
+
+    assert asyncio.run(main()) == ["cancelled"]
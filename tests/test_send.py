@@ -0,0 +1,187 @@
+import asyncio
+
+from fastapi import HTTPException
+import httpx
+import pytest
+
+from integrations.base import OAuthIntegration
+from integrations.base.resilience import CircuitBreaker
+from settings import Settings
+
+URL = "https://provider.example.com/items"
+
+
+def make_integration(**overrides) -> OAuthIntegration:
+    values = {
+        "client_id": "client_id",
+        "client_secret": "client_secret",
+        "auth_url": "https://provider.example.com/authorize",
+        "redirect_uri": "http://localhost:8000/callback",
+        "breaker_failure_threshold": 2,
+        "breaker_reset_timeout": 60.0,
+        "hedge_delay": 0.02,
+        **overrides,
+    }
+
+    class FakeIntegration(OAuthIntegration):
+        PREFIX = "fake"
+        SETTINGS = Settings(**values)
+
+        async def authorize(self, user_id, org_id):
+            raise NotImplementedError
+
+        async def oauth2callback(self, request):
+            raise NotImplementedError
+
+        async def get_items(self, credentials):
+            raise NotImplementedError
+
+    return FakeIntegration()
+
+
+def send(integration, handler, **kwargs):
+    async def main():
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await integration._send(client, "items", "GET", URL, **kwargs)
+
+    return asyncio.run(main())
+
+
+def test_5xx_responses_count_as_failures():
+    integration = make_integration()
+
+    for _ in range(2):
+        send(integration, lambda request: httpx.Response(502))
+
+    assert integration._breaker("items").state == CircuitBreaker.OPEN
+
+
+def test_4xx_responses_do_not_count_as_failures():
+    integration = make_integration()
+
+    for _ in range(3):
+        assert send(integration, lambda request: httpx.Response(404)).status_code == 404
+
+    assert integration._breaker("items").state == CircuitBreaker.CLOSED
+
+
+def test_open_circuit_raises_503():
+    integration = make_integration()
+    for _ in range(2):
+        send(integration, lambda request: httpx.Response(500))
+
+    calls = []
+    with pytest.raises(HTTPException) as exc_info:
+        send(integration, lambda request: calls.append(request) or httpx.Response(200))
+
+    assert exc_info.value.status_code == 503
+    assert calls == []
+
+
+def test_transport_errors_trip_the_breaker():
+    integration = make_integration()
+
+    def handler(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            send(integration, handler)
+
+    assert integration._breaker("items").state == CircuitBreaker.OPEN
+
+
+def test_cancelled_probe_releases_slot():
+    integration = make_integration(breaker_reset_timeout=0.0)
+    for _ in range(2):
+        send(integration, lambda request: httpx.Response(500))
+    breaker = integration._breaker("items")
+
+    async def slow(request):
+        await asyncio.sleep(1.0)
+        return httpx.Response(200)
+
+    async def main():
+        transport = httpx.MockTransport(slow)
+        async with httpx.AsyncClient(transport=transport) as client:
+            probe = asyncio.ensure_future(
+                integration._send(client, "items", "GET", URL)
+            )
+            await asyncio.sleep(0.01)
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+
+    asyncio.run(main())
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.before_call() is True
+
+
+def slow_first_handler(calls):
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.3 if len(calls) == 1 else 0.0)
+        return httpx.Response(200, json={"attempt": len(calls)})
+
+    return handler
+
+
+def fill_hedge_budget(integration):
+    budget = integration._hedge_budget("items")
+    for _ in range(20):
+        budget.deposit()
+
+
+def test_hedge_requires_hedge_enabled():
+    integration = make_integration(hedge_enabled=False)
+    fill_hedge_budget(integration)
+    calls = []
+
+    response = send(integration, slow_first_handler(calls), hedge=True)
+
+    assert response.json() == {"attempt": 1}
+    assert len(calls) == 1
+
+
+def test_hedge_requires_hedge_flag():
+    integration = make_integration(hedge_enabled=True)
+    fill_hedge_budget(integration)
+    calls = []
+
+    response = send(integration, slow_first_handler(calls))
+
+    assert response.json() == {"attempt": 1}
+    assert len(calls) == 1
+
+
+def test_hedge_fires_when_enabled():
+    integration = make_integration(hedge_enabled=True)
+    fill_hedge_budget(integration)
+    calls = []
+
+    response = send(integration, slow_first_handler(calls), hedge=True)
+
+    assert response.json() == {"attempt": 2}
+    assert len(calls) == 2
+
+
+def test_hedged_call_records_one_lower_bound_sample():
+    integration = make_integration(hedge_enabled=True)
+    fill_hedge_budget(integration)
+
+    send(integration, slow_first_handler([]), hedge=True)
+
+    samples = list(integration._latency("items")._samples)
+    assert len(samples) == 1
+    assert samples[0] >= integration.SETTINGS.hedge_delay
+
+
+def test_5xx_responses_are_not_sampled():
+    integration = make_integration()
+
+    send(integration, lambda request: httpx.Response(503))
+    send(integration, lambda request: httpx.Response(200))
+
+    assert len(integration._latency("items")._samples) == 1
@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+import tracing
+
+
+def test_children_are_noop_without_exporter(monkeypatch):
+    monkeypatch.setattr(tracing, "exporter", None)
+
+    with tracing.span("root") as root:
+        with tracing.span("child") as child:
+            child.set_attribute("key", "value")
+
+    assert root.trace_id and root.span_id
+    assert child is tracing.NOOP_SPAN
+    assert child.attributes == {}
+
+
+def test_children_share_trace_with_root(monkeypatch):
+    exporter = tracing.InMemorySpanExporter()
+    monkeypatch.setattr(tracing, "exporter", exporter)
+
+    with tracing.span("root") as root:
+        with tracing.span("child"):
+            pass
+
+    child, exported_root = exporter.get_trace(root.trace_id)
+    assert exported_root is root
+    assert child.parent_span_id == root.span_id
+
+
+def test_file_exporter_writes_spans(monkeypatch, tmp_path):
+    path = tmp_path / "traces.jsonl"
+    exporter = tracing.FileSpanExporter(str(path))
+    monkeypatch.setattr(tracing, "exporter", exporter)
+
+    with tracing.span("root", key="value") as root:
+        pass
+    exporter.shutdown()
+
+    (line,) = path.read_text().splitlines()
+    (resource_spans,) = json.loads(line)["resourceSpans"]
+    (scope_spans,) = resource_spans["scopeSpans"]
+    (exported,) = scope_spans["spans"]
+    assert exported["spanId"] == root.span_id
+    assert exported["attributes"] == [
+        {"key": "key", "value": {"stringValue": "value"}}
+    ]
+
+
+def test_span_serialises_to_otlp_json(monkeypatch):
+    monkeypatch.setattr(tracing, "exporter", None)
+
+    with pytest.raises(RuntimeError):
+        with tracing.span(
+            "root", kind=tracing.SPAN_KIND_SERVER, text="a", count=2, ok=True, p=0.5
+        ) as root:
+            raise RuntimeError("boom")
+
+    exported = root.to_dict()
+    assert exported["kind"] == tracing.SPAN_KIND_SERVER
+    assert exported["parentSpanId"] == ""
+    assert int(exported["endTimeUnixNano"]) >= int(exported["startTimeUnixNano"])
+    assert exported["attributes"] == [
+        {"key": "text", "value": {"stringValue": "a"}},
+        {"key": "count", "value": {"intValue": "2"}},
+        {"key": "ok", "value": {"boolValue": True}},
+        {"key": "p", "value": {"doubleValue": 0.5}},
+    ]
+    assert exported["status"] == {
+        "code": tracing.STATUS_CODE_ERROR,
+        "message": "RuntimeError('boom')",
+    }
+
+
+def test_root_continues_valid_traceparent(monkeypatch):
+    monkeypatch.setattr(tracing, "exporter", None)
+    traceparent = f"00-{'a' * 32}-{'b' * 16}-01"
+
+    with tracing.span("root", traceparent=traceparent) as root:
+        pass
+
+    assert root.trace_id == "a" * 32
+    assert root.parent_span_id == "b" * 16
+
+
+def test_root_ignores_invalid_traceparent(monkeypatch):
+    monkeypatch.setattr(tracing, "exporter", None)
+
+    for traceparent in (
+        f"00-{'0' * 32}-{'b' * 16}-01",
+        f"00-{'a' * 32}-{'0' * 16}-01",
+        "not-a-traceparent",
+    ):
+        with tracing.span("root", traceparent=traceparent) as root:
+            pass
+        assert root.trace_id not in ("a" * 32, "0" * 32)
+        assert root.parent_span_id is None
+
+
+def test_in_memory_exporter_caps_spans_per_trace(monkeypatch):
+    exporter = tracing.InMemorySpanExporter(max_traces=2, max_spans_per_trace=3)
+    monkeypatch.setattr(tracing, "exporter", exporter)
+    traceparent = f"00-{'a' * 32}-{'b' * 16}-01"
+
+    roots = []
+    for _ in range(10):
+        with tracing.span("root", traceparent=traceparent) as root:
+            roots.append(root)
+
+    assert exporter.get_trace("a" * 32) == roots[-3:]
@@ -0,0 +1,244 @@
+import atexit
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import json
+import queue
+import re
+import secrets
+import threading
+import time
+from typing import Any, Protocol
+
+from settings import app_settings
+
+TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+INVALID_TRACE_ID = "0" * 32
+INVALID_SPAN_ID = "0" * 16
+
+# OTLP/JSON encodes enums as their integer values.
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+STATUS_CODE_UNSET = 0
+STATUS_CODE_ERROR = 2
+
+SERVICE_NAME = "oauth-integrations-backend"
+
+
+def _any_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _key_values(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": k, "value": _any_value(v)} for k, v in attributes.items()]
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None = None
+    kind: int = SPAN_KIND_INTERNAL
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_time_unix_nano: int = field(default_factory=time.time_ns)
+    end_time_unix_nano: int | None = None
+    status: int = STATUS_CODE_UNSET
+    status_message: str | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise as an OTLP/JSON ``Span``."""
+        status: dict[str, Any] = {"code": self.status}
+        if self.status_message is not None:
+            status["message"] = self.status_message
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id or "",
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_time_unix_nano),
+            "endTimeUnixNano": str(self.end_time_unix_nano or 0),
+            "attributes": _key_values(self.attributes),
+            "status": status,
+        }
+
+
+def to_otlp(spans: Iterable[Span]) -> dict[str, Any]:
+    """Wrap spans in an OTLP/JSON ``ExportTraceServiceRequest``."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": _key_values({"service.name": SERVICE_NAME})},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": __name__},
+                        "spans": [span.to_dict() for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class NoopSpan(Span):
+    """Stand-in for child spans when no exporter is configured."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+NOOP_SPAN = NoopSpan(name="", trace_id="", span_id="")
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+
+class InMemorySpanExporter:
+    """Keeps finished spans of the most recent traces, for local inspection.
+
+    Trace ids can come from a client's ``traceparent``, so each trace is also
+    capped to its most recent ``max_spans_per_trace`` spans.
+    """
+
+    def __init__(self, max_traces: int = 100, max_spans_per_trace: int = 1000) -> None:
+        self.max_traces = max_traces
+        self.max_spans_per_trace = max_spans_per_trace
+        self._traces: OrderedDict[str, deque[Span]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            if span.trace_id not in self._traces:
+                self._traces[span.trace_id] = deque(maxlen=self.max_spans_per_trace)
+            self._traces[span.trace_id].append(span)
+            self._traces.move_to_end(span.trace_id)
+            while len(self._traces) > self.max_traces:
+                self._traces.popitem(last=False)
+
+    def get_trace(self, trace_id: str) -> list[Span]:
+        with self._lock:
+            return list(self._traces.get(trace_id, []))
+
+
+class FileSpanExporter:
+    """Appends finished spans to a file in the OTLP/JSON file format, one
+    ``ExportTraceServiceRequest`` per line, as read by the OpenTelemetry
+    Collector's ``otlpjsonfile`` receiver.
+
+    Spans are queued and written in batches by a background thread, so that
+    exporting never blocks the event loop on disk I/O.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._queue: queue.SimpleQueue[Span | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def export(self, span: Span) -> None:
+        self._queue.put(span)
+
+    def shutdown(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get())
+
+            spans = [s for s in batch if s is not None]
+            if spans:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(to_otlp(spans)) + "\n")
+            if None in batch:
+                return
+
+
+def _build_exporter() -> SpanExporter | None:
+    if app_settings.trace_exporter == "memory":
+        return InMemorySpanExporter()
+    if app_settings.trace_exporter == "file":
+        return FileSpanExporter(app_settings.trace_file)
+    return None
+
+
+exporter = _build_exporter()
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def parse_traceparent(traceparent: str | None) -> tuple[str, str] | None:
+    """Return the trace and parent span ids of a valid W3C ``traceparent``."""
+    if not traceparent or not (match := TRACEPARENT_RE.match(traceparent)):
+        return None
+    trace_id, parent_span_id = match.group(1), match.group(2)
+    if trace_id == INVALID_TRACE_ID or parent_span_id == INVALID_SPAN_ID:
+        return None
+    return trace_id, parent_span_id
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+@contextmanager
+def span(
+    name: str,
+    traceparent: str | None = None,
+    kind: int = SPAN_KIND_INTERNAL,
+    **attributes: Any,
+) -> Iterator[Span]:
+    """Open a span as a child of the current one.
+
+    A root span continues the trace from a W3C ``traceparent`` header when one
+    is given. Without an exporter only the root span is recorded, since its
+    ids are still needed for the response header and profiles.
+    """
+    parent = _current_span.get()
+    if parent is not None and exporter is None:
+        yield NOOP_SPAN
+        return
+
+    if parent is not None:
+        trace_id, parent_span_id = parent.trace_id, parent.span_id
+    elif (ids := parse_traceparent(traceparent)) is not None:
+        trace_id, parent_span_id = ids
+    else:
+        trace_id, parent_span_id = secrets.token_hex(16), None
+
+    current = Span(
+        name=name,
+        trace_id=trace_id,
+        span_id=secrets.token_hex(8),
+        parent_span_id=parent_span_id,
+        kind=kind,
+        attributes=attributes,
+    )
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = STATUS_CODE_ERROR
+        current.status_message = repr(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        current.end_time_unix_nano = time.time_ns()
+        if exporter is not None:
+            exporter.export(current)